@@ -1,24 +1,58 @@
 import os
+import io
 import json
+import logging
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageDraw, ImageFont
 from fpdf import FPDF
-import pandas as pd
+import multiprocessing
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import queue
+from functools import lru_cache
+from types import MappingProxyType
 
 # Constants
 CONFIG_FILE = 'config.json'
 OUTPUT_FOLDER = "Badge_output"
 PRINT_FOLDER = "print"
 DEFAULT_DPI = 300
+TMP_SUFFIX = '.tmp'  # Suffix of badge files still being written
+PROGRESS_INTERVAL = 0.1  # Minimum seconds between batch progress updates sent to the GUI
 HINT_TEXT = "Please enter the code after 'No.'."
+ID_PREFIX = "No. "  # Prefix printed before every employee ID
+SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})  # Illegal filename characters
+
+logger = logging.getLogger(__name__)
 
 # Queue for thread-safe GUI operations
 gui_queue = queue.Queue()
 
+# Main window, set by create_gui so other threads can wake it when work is queued
+gui_window = None
+
+# Single background thread that writes encoded badges to disk, created per process by get_file_writer
+file_writer = None
+file_writer_pid = None
+
+# Read-only preset templates, options and renderers for batch worker processes, set up by _init_batch_worker
+batch_worker_state = {}
+
+def post_to_gui(callback):
+    """
+    Queue a GUI operation from any thread and notify the Tk event loop to run it.
+
+    :param callback: Function to run on the GUI thread.
+    """
+    gui_queue.put(callback)
+    if gui_window is not None:
+        try:
+            gui_window.event_generate('<<GuiQueue>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass  # The backup poll in create_gui picks the callback up
+
 def load_config(config_file):
     """
     Load and parse the configuration JSON file.
@@ -34,17 +68,119 @@ def load_config(config_file):
     except json.JSONDecodeError as e:
         raise Exception(f"Error parsing '{config_file}': {e}")
 
+@lru_cache(maxsize=64)
+def _get_font(font_path, size):
+    """
+    Load a TrueType font, reusing the parsed face for repeated (path, size) pairs.
+
+    :param font_path: Path to the font file.
+    :param size: Font size in points.
+    :return: ImageFont.FreeTypeFont instance.
+    """
+    return ImageFont.truetype(font_path, size)
+
+@lru_cache(maxsize=8)
+def _load_background(image_path, modified):
+    """
+    Load and decode a badge background once. Callers must copy the result before drawing on it.
+
+    :param image_path: Path to the background image.
+    :param modified: File modification time (st_mtime_ns), so an edited background is reloaded.
+    :return: RGBA Image.
+    """
+    with Image.open(image_path) as img:
+        img.load()
+        # Backgrounds are often RGBA already; only convert (and allocate a new buffer) when needed
+        if img.mode != 'RGBA':
+            img = img.convert('RGBA')
+    return img
+
+@lru_cache(maxsize=256)
+def _load_resized_photo(photo_path, size, modified):
+    """
+    Load a photo already resized to the badge photo slot, reusing it when the same photo repeats.
+
+    :param photo_path: Path to the photo file.
+    :param size: Target (width, height) tuple.
+    :param modified: File modification time (st_mtime_ns), so an edited photo is reloaded.
+    :return: Tuple of (RGBA Image, paste mask). The mask is None when the photo is fully
+             opaque, so pasting it is a plain copy instead of an alpha blend. Callers must not modify them.
+    """
+    width, height = size
+    with Image.open(photo_path) as photo:
+        # Let libjpeg decode large JPEGs at 1/2, 1/4 or 1/8 scale, keeping at least twice the
+        # target size so LANCZOS still has detail to work with; a no-op for other formats
+        photo.draft('RGB', (width * 2, height * 2))
+        # reducing_gap shrinks other large sources with a cheap box reduce before LANCZOS
+        photo = photo.convert('RGBA').resize(size, Image.LANCZOS, reducing_gap=3.0)
+    min_alpha, _ = photo.getchannel('A').getextrema()
+    return photo, (photo if min_alpha < 255 else None)
+
+@lru_cache(maxsize=4096)
+def _render_text_mask(font, text):
+    """
+    Rasterize text into a tightly cropped coverage mask, reusing it for repeated strings.
+
+    :param font: ImageFont.FreeTypeFont instance (from _get_font, so identical fonts share a cache key).
+    :param text: Text to render.
+    :return: Tuple of (mask, (offset_x, offset_y)) relative to the draw position, or None for blank text.
+    """
+    # font.getbbox only measures a single line, so size the mask the way draw.text lays out multiline text
+    left, top, right, bottom = ImageDraw.Draw(Image.new('L', (1, 1))).multiline_textbbox((0, 0), text, font=font)
+    if right <= left or bottom <= top:
+        return None
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+def _draw_text(img, font, text, color, position):
+    """
+    Draw text onto an image using the cached text mask.
+
+    :param img: Image to draw on.
+    :param font: ImageFont.FreeTypeFont instance.
+    :param text: Text to draw.
+    :param color: Fill color.
+    :param position: (x, y) draw position.
+    """
+    rendered = _render_text_mask(font, text)
+    if rendered is None:
+        return
+    mask, (offset_x, offset_y) = rendered
+    img.paste(color, (position[0] + offset_x, position[1] + offset_y), mask)
+
+@lru_cache(maxsize=8)
+def _load_base_canvas(image_path, modified, static_text):
+    """
+    Build the part of a badge shared by every employee: the background with static text drawn on it.
+    Callers must copy the result before drawing on it.
+
+    :param image_path: Path to the background image.
+    :param modified: Background file modification time (st_mtime_ns).
+    :param static_text: Tuple of (text, font, color, position) tuples to draw.
+    :return: RGBA Image.
+    """
+    img = _load_background(image_path, modified)
+    if static_text:
+        img = img.copy()
+        for text, font, color, position in static_text:
+            _draw_text(img, font, text, color, position)
+    return img
+
 def get_image_dimensions(image_path):
     """
     Calculate image dimensions in millimeters based on DPI.
+    Only the image header is parsed; pixel data is never loaded.
 
-    :param image_path: Path to the image file.
+    :param image_path: Path to the image file or a file-like object.
     :return: Tuple of (width_mm, height_mm).
     """
     with Image.open(image_path) as img:
         dpi = img.info.get('dpi', (DEFAULT_DPI, DEFAULT_DPI))[0]
         width_mm = (img.width / dpi) * 25.4
         height_mm = (img.height / dpi) * 25.4
+    if hasattr(image_path, 'seek'):
+        image_path.seek(0)  # Rewind so the stream can be read again
     return width_mm, height_mm
 
 def sanitize_filename(filename):
@@ -54,10 +190,7 @@ def sanitize_filename(filename):
     :param filename: Original filename.
     :return: Sanitized filename.
     """
-    illegal_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-    for char in illegal_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(SANITIZE_TABLE)
 
 def clean_employee_id(employee_id):
     """
@@ -70,116 +203,198 @@ def clean_employee_id(employee_id):
         return employee_id[:-2]
     return employee_id
 
-def generate_badge(side, data, suppress_message=False):
+def get_file_writer():
     """
-    Generate a single badge image for the specified side ('front' or 'back').
+    Return this process's badge writer thread pool, creating it on first use.
+
+    A forked child inherits the parent's executor object but not its thread, so the
+    writer is keyed on the process ID and recreated in any new process.
+
+    :return: ThreadPoolExecutor with a single worker thread.
+    """
+    global file_writer, file_writer_pid
+    if file_writer is None or file_writer_pid != os.getpid():
+        file_writer = ThreadPoolExecutor(max_workers=1)
+        file_writer_pid = os.getpid()
+    return file_writer
+
+def write_file(path, payload):
+    """
+    Write bytes to a file atomically, so an interrupted run never leaves a partial file behind.
+
+    :param path: Destination file path.
+    :param payload: Bytes to write.
+    """
+    tmp_path = path + TMP_SUFFIX
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def badge_filename(side, badge_id):
+    """
+    Build the output path of a badge image.
 
     :param side: 'front' or 'back'.
-    :param data: Dictionary containing badge data.
-    :param suppress_message: If True, suppress success message.
+    :param badge_id: Badge ID text, e.g. ID_PREFIX + '123'.
+    :return: Path inside the output folder.
     """
-    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    name_for_filename = badge_id[len(ID_PREFIX):] if badge_id.startswith(ID_PREFIX) else badge_id
+    name_for_filename = sanitize_filename(name_for_filename)  # Ensure filename is safe
+    return os.path.join(OUTPUT_FOLDER, f"badge_{side}_{name_for_filename}.png")
 
-    # Handle name splitting if necessary
-    name = data.get('name', '')
-    char_limit = data.get('name_char_limit', 10)
+def make_badge_renderer(preset, side, save_to_disk=True):
+    """
+    Specialize badge rendering for one side of a preset.
 
-    if len(name) > char_limit:
-        if ' ' in name:
-            first, last = name.split(' ', 1)
-            data.update({
-                'first_name': first,
-                'last_name': last,
-                'text_elements': ['first_name', 'last_name', 'id', 'department', 'position']
-            })
-        else:
-            error_msg = (f"The name '{name}' is too long. "
-                         "Please use spaces to separate first and last names or edit it manually.")
-            if not suppress_message:
-                gui_queue.put(lambda: messagebox.showerror("Error", error_msg))
-            else:
-                raise Exception(error_msg)
-            return
-    else:
-        data.update({
-            'text_elements': ['name', 'id', 'department', 'position']
-        })
+    Everything shared by every badge (fonts, colors, positions and the base canvas) is
+    resolved once here, so the returned function only draws the per-employee fields.
 
-    # Load background image
+    :param preset: Preset mapping for the side.
+    :param side: 'front' or 'back'.
+    :param save_to_disk: If False, the renderer returns in-memory JPEGs instead of writing PNGs.
+    :return: Function taking a (name, badge_id, department, position, photo_img) tuple and
+             returning the future of the pending disk write, or a BytesIO holding the JPEG
+             badge when save_to_disk is False. photo_img may be None to use the preset's photo.
+    """
+    def load_text_style(key):
+        try:
+            font = _get_font(preset[f'font_{key}'], int(preset[f'{key}_size']))
+        except IOError as e:
+            raise Exception(f"Font not found: {e}")
+        return font, preset.get(f'{key}_color', 'black'), tuple(preset.get(f'{key}_position', (0, 0)))
+
+    if save_to_disk:
+        os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+
+    # Background with static preset text drawn on it
+    static_text = tuple(
+        (preset.get(key, ''), *load_text_style(key))
+        for key in preset.get('static_text_elements', [])
+    )
     try:
-        with Image.open(data['background_img']) as img:
-            img = img.convert("RGBA")  # Ensure image is in RGBA mode
+        background_img = preset['background_img']
+        base = _load_base_canvas(background_img, os.stat(background_img).st_mtime_ns, static_text)
     except Exception as e:
-        error_msg = f"Failed to load {side} image: {e}"
-        if not suppress_message:
-            gui_queue.put(lambda: messagebox.showerror("Error", error_msg))
+        raise Exception(f"Failed to load {side} image: {e}")
+
+    name_style = load_text_style('name')
+    id_style = load_text_style('id')
+    department_style = load_text_style('department')
+    position_style = load_text_style('position')
+    split_name_styles = []  # First and last name styles, loaded when a name first needs splitting
+
+    char_limit = preset.get('name_char_limit', 10)
+    default_photo = preset.get('photo_img')
+
+    def render(values):
+        name, badge_id, department, position, photo_img = values
+
+        # Handle name splitting if necessary
+        if len(name) > char_limit:
+            if ' ' not in name:
+                raise Exception(f"The name '{name}' is too long. "
+                                "Please use spaces to separate first and last names or edit it manually.")
+            if not split_name_styles:
+                split_name_styles.extend([load_text_style('first_name'), load_text_style('last_name')])
+            first, last = name.split(' ', 1)
+            name_fields = [(first, split_name_styles[0]), (last, split_name_styles[1])]
         else:
-            raise Exception(error_msg)
-        return
+            name_fields = [(name, name_style)]
 
-    # Insert photo if front side and photo provided
-    if side == 'front' and data.get('photo_img'):
-        try:
-            with Image.open(data['photo_img']) as photo:
-                photo = photo.resize(tuple(data['photo_size']), Image.LANCZOS)
-                img.paste(photo, tuple(data['photo_position']), photo if photo.mode == 'RGBA' else None)
-        except Exception as e:
-            error_msg = f"Failed to insert photo: {e}"
-            if not suppress_message:
-                gui_queue.put(lambda: messagebox.showerror("Error", error_msg))
-            else:
-                raise Exception(error_msg)
-            return
+        img = base.copy()
 
-    draw = ImageDraw.Draw(img)
+        # Insert photo if front side and photo provided
+        if photo_img is None:
+            photo_img = default_photo
+        if side == 'front' and photo_img:
+            try:
+                photo, photo_mask = _load_resized_photo(
+                    photo_img, tuple(preset['photo_size']), os.stat(photo_img).st_mtime_ns
+                )
+                img.paste(photo, tuple(preset['photo_position']), photo_mask)
+            except Exception as e:
+                raise Exception(f"Failed to insert photo: {e}")
 
-    # Load fonts and colors
-    try:
-        fonts = {
-            key: ImageFont.truetype(data[f'font_{key}'], int(data[f'{key}_size']))
-            for key in data['text_elements']
-        }
-        colors = {
-            key: data.get(f'{key}_color', 'black')
-            for key in data['text_elements']
-        }
-    except IOError as e:
-        error_msg = f"Font not found: {e}"
-        if not suppress_message:
-            gui_queue.put(lambda: messagebox.showerror("Error", error_msg))
-        else:
-            raise Exception(error_msg)
-        return
+        # Draw text elements
+        for text, (font, color, xy) in name_fields + [
+            (badge_id, id_style),
+            (department, department_style),
+            (position, position_style),
+        ]:
+            _draw_text(img, font, text, color, xy)
 
-    # Draw text elements
-    for element in data['text_elements']:
-        position = tuple(data.get(f'{element}_position', (0, 0)))
-        text = data.get(element, '')
-        font = fonts[element]
-        color = colors[element]
-        draw.text(position, text, font=font, fill=color)
-
-    # Generate output filename
-    employee_id = data.get('id', '')
-    name_for_filename = employee_id[4:] if employee_id.startswith('No.') else employee_id
-    name_for_filename = sanitize_filename(name_for_filename)  # Ensure filename is safe
-    output_filename = os.path.join(OUTPUT_FOLDER, f"badge_{side}_{name_for_filename}.png")
+        buffer = io.BytesIO()
+
+        # Keep the badge in memory when it goes straight into a PDF
+        if not save_to_disk:
+            # JPEG has no alpha: flatten onto white paper, as the PDF shows transparent PNG areas
+            flattened = Image.alpha_composite(Image.new('RGBA', img.size, 'white'), img).convert('RGB')
+            flattened.save(buffer, format='JPEG', quality=92, dpi=(DEFAULT_DPI, DEFAULT_DPI))
+            buffer.seek(0)
+            return buffer
+
+        # Encode the badge in memory and hand the disk write to the writer thread
+        img.save(buffer, format='PNG', compress_level=1)
+        return get_file_writer().submit(write_file, badge_filename(side, badge_id), buffer.getvalue())
 
-    # Save the badge image
-    img.save(output_filename, quality=100)
+    return render
+
+def generate_badge(side, data, suppress_message=False, save_to_disk=True):
+    """
+    Generate a single badge image for the specified side ('front' or 'back').
+
+    :param side: 'front' or 'back'.
+    :param data: Dictionary containing badge data.
+    :param suppress_message: If True, suppress success message.
+    :param save_to_disk: If False, return the badge as an in-memory JPEG instead of writing a PNG.
+    :return: Future of the pending disk write, a BytesIO holding the JPEG badge
+             when save_to_disk is False, or None if generation failed.
+    """
+    try:
+        render = make_badge_renderer(data, side, save_to_disk)
+        result = render((
+            data.get('name', ''),
+            data.get('id', ''),
+            data.get('department', ''),
+            data.get('position', ''),
+            data.get('photo_img'),
+        ))
+    except Exception as e:
+        if suppress_message:
+            raise
+        error_msg = str(e)
+        post_to_gui(lambda: messagebox.showerror("Error", error_msg))
+        return
 
     # Notify user
-    if not suppress_message:
-        gui_queue.put(lambda: messagebox.showinfo(
+    if save_to_disk and not suppress_message:
+        try:
+            result.result()
+        except Exception as e:
+            error_msg = f"Failed to save badge: {e}"
+            post_to_gui(lambda: messagebox.showerror("Error", error_msg))
+            return
+        output_filename = badge_filename(side, data.get('id', ''))
+        post_to_gui(lambda: messagebox.showinfo(
             "Success",
             f"{side.capitalize()} Badge saved as {output_filename}"
         ))
 
-def generate_badge_pdf(config):
+    return result
+
+def generate_badge_pdf(config, badges=None):
     """
     Generate a PDF containing all badge front and back images based on the configuration.
 
     :param config: Configuration dictionary.
+    :param badges: Optional list of (key, front, back) tuples, where front and back are
+                   file paths or in-memory streams (or None). When omitted, the badges
+                   are read from the configured badge folder.
     :return: Path to the generated PDF.
     """
     try:
@@ -201,54 +416,68 @@ def generate_badge_pdf(config):
         pdf = FPDF(orientation='P', unit='mm', format=(paper_width, paper_height))
         pdf.set_auto_page_break(auto=True, margin=15)
 
-        # Retrieve and sort badge files
-        try:
-            files = os.listdir(badge_folder)
-        except FileNotFoundError:
-            raise Exception(f"Badge folder '{badge_folder}' does not exist.")
-
-        front_files = sorted([f for f in files if f.startswith(front_prefix)])
-        back_files = sorted([f for f in files if f.startswith(back_prefix)])
+        # Badges from a single batch share one preset, while the folder can mix presets across runs
+        single_preset = badges is not None
 
-        # Create dictionaries for front and back files keyed by their identifier
-        front_files_dict = {f[len(front_prefix):-4]: f for f in front_files}
-        back_files_dict = {f[len(back_prefix):-4]: f for f in back_files}
-
-        # Get all unique keys
-        all_keys = sorted(set(front_files_dict.keys()).union(back_files_dict.keys()))
+        if badges is None:
+            # Pair front and back badge files by their identifier in a single directory pass
+            front_len = len(front_prefix)
+            back_len = len(back_prefix)
+            pairs = {}
+            try:
+                with os.scandir(badge_folder) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.endswith(TMP_SUFFIX):
+                            continue  # Skip badges that are still being written
+                        if name.startswith(front_prefix):
+                            pairs.setdefault(name[front_len:-4], [None, None])[0] = entry.path
+                        elif name.startswith(back_prefix):
+                            pairs.setdefault(name[back_len:-4], [None, None])[1] = entry.path
+            except FileNotFoundError:
+                raise Exception(f"Badge folder '{badge_folder}' does not exist.")
+
+            badges = [(key, front, back) for key, (front, back) in sorted(pairs.items())]
+
+        # All badges of a side in a batch come from the same preset, so read their dimensions once
+        front_dims = back_dims = None
+        if single_preset:
+            try:
+                first_front = next((front for _, front, _ in badges if front), None)
+                first_back = next((back for _, _, back in badges if back), None)
+                front_dims = get_image_dimensions(first_front) if first_front else None
+                back_dims = get_image_dimensions(first_back) if first_back else None
+            except Exception as e:
+                raise Exception(f"Failed to read badge image dimensions: {e}")
 
         # Arrange badges in groups of three per page
-        for i in range(0, len(all_keys), 3):
+        for i in range(0, len(badges), 3):
             pdf.add_page()
             for j in range(3):
-                if i + j >= len(all_keys):
+                if i + j >= len(badges):
                     break
 
-                key = all_keys[i + j]
-                front_img_path = front_files_dict.get(key)
-                back_img_path = back_files_dict.get(key)
+                key, front_img, back_img = badges[i + j]
 
                 x_pos = (badge_width + group_spacing_x) * j + group_spacing_x
                 y_pos = start_y
 
                 # Insert front image if available
-                if front_img_path:
-                    front_full_path = os.path.join(badge_folder, front_img_path)
+                if front_img:
                     try:
-                        front_width_mm, front_height_mm = get_image_dimensions(front_full_path)
-                        pdf.image(front_full_path, x=x_pos, y=y_pos, w=front_width_mm, h=front_height_mm)
+                        front_width_mm, front_height_mm = front_dims or get_image_dimensions(front_img)
+                        pdf.image(front_img, x=x_pos, y=y_pos, w=front_width_mm, h=front_height_mm)
                         y_pos += front_height_mm + group_spacing_y
                     except Exception as e:
-                        raise Exception(f"Failed to insert front image '{front_full_path}': {e}")
+                        raise Exception(f"Failed to insert front image for '{key}': {e}")
 
                 # Insert back image if available
-                if back_img_path:
-                    back_full_path = os.path.join(badge_folder, back_img_path)
+                if back_img:
                     try:
-                        back_width_mm, back_height_mm = get_image_dimensions(back_full_path)
-                        pdf.image(back_full_path, x=x_pos, y=y_pos, w=back_width_mm, h=back_height_mm)
+                        back_width_mm, back_height_mm = back_dims or get_image_dimensions(back_img)
+                        pdf.image(back_img, x=x_pos, y=y_pos, w=back_width_mm, h=back_height_mm)
                     except Exception as e:
-                        raise Exception(f"Failed to insert back image '{back_full_path}': {e}")
+                        raise Exception(f"Failed to insert back image for '{key}': {e}")
 
         # Ensure output directories exist
         os.makedirs(PRINT_FOLDER, exist_ok=True)
@@ -348,10 +577,14 @@ def create_side_frame(parent, side, selected_preset, presets):
         preset = presets[preset_name][side]
         data = preset.copy()
 
+        employee_id = entries['id'].get().strip()
+        if not employee_id.isupper():
+            employee_id = employee_id.upper()
+
         # Gather user input
         data.update({
             'name': entries['name'].get().strip(),
-            'id': f"No. {entries['id'].get().strip().upper()}",
+            'id': ID_PREFIX + employee_id,
             'department': entries['department'].get().strip(),
             'position': entries['position'].get().strip(),
         })
@@ -371,25 +604,131 @@ def create_side_frame(parent, side, selected_preset, presets):
 
     return frame
 
-def batch_generate_badges(presets, selected_preset_name, error_log_path):
+def read_employee_sheet(file_path):
+    """
+    Read the employee list, preferring the fastest installed pandas engine.
+
+    Excel files are read with python-calamine and CSV files with pyarrow when
+    available, falling back to the pandas defaults otherwise.
+
+    :param file_path: Path to the Excel or CSV file.
+    :return: DataFrame with 'Employee Number' read as strings.
+    """
+    # Imported here so batch worker processes, which only see plain dict rows, never load pandas
+    import pandas as pd
+
+    dtype = {'Employee Number': str}  # Keep employee numbers as text
+    if file_path.lower().endswith('.csv'):
+        reader, fast_engine = pd.read_csv, 'pyarrow'
+    else:
+        reader, fast_engine = pd.read_excel, 'calamine'
+
+    try:
+        df = reader(file_path, dtype=dtype, engine=fast_engine)
+        logger.info("Read '%s' with the %s engine", file_path, fast_engine)
+    except (ImportError, ValueError) as e:
+        # Fall back only when the engine is not installed or not supported by this pandas version;
+        # other ValueErrors are real parse errors and must reach the user
+        if isinstance(e, ValueError) and 'Unknown engine' not in str(e):
+            raise
+        df = reader(file_path, dtype=dtype)
+        logger.info("Read '%s' with the default engine (%s unavailable: %s)", file_path, fast_engine, e)
+    return df
+
+def _init_batch_worker(preset_front, preset_back, save_to_disk):
+    """
+    Store the static preset data in a batch worker process once, instead of shipping it with every row.
+
+    :param preset_front: Front preset dictionary.
+    :param preset_back: Back preset dictionary.
+    :param save_to_disk: Whether badges are written to disk or returned in memory.
+    """
+    batch_worker_state.update({
+        'front_template': MappingProxyType(preset_front),
+        'back_template': MappingProxyType(preset_back),
+        'save_to_disk': save_to_disk,
+    })
+
+def _get_batch_renderer(side):
     """
-    Batch generate badges from an Excel file using the selected preset.
+    Return this worker's badge renderer for a preset side, building it on first use.
+    Building lazily keeps preset problems (e.g. a missing background) reported per row.
+
+    :param side: 'front' or 'back'.
+    :return: Renderer from make_badge_renderer.
+    """
+    key = f'{side}_renderer'
+    if key not in batch_worker_state:
+        batch_worker_state[key] = make_badge_renderer(
+            batch_worker_state[f'{side}_template'], side, batch_worker_state['save_to_disk']
+        )
+    return batch_worker_state[key]
+
+def _process_row(args):
+    """
+    Generate the front and back badges for a single, already validated spreadsheet row.
+
+    Runs inside a worker process set up by _init_batch_worker, so it only receives
+    picklable arguments and reports problems by returning them instead of touching shared state.
+
+    :param args: Tuple of (index, row).
+    :return: Tuple of (errors, badge). errors is a list of error messages (empty on success);
+             badge is a (key, front, back) tuple of in-memory JPEGs when badges are not
+             saved to disk, otherwise None.
+    """
+    index, row = args
+    employee_id = row['Employee Number']
+    full_id = ID_PREFIX + employee_id
+    save_to_disk = batch_worker_state['save_to_disk']
+    try:
+        # Generate front and back badges with this worker's preset-specialized renderers
+        front = _get_batch_renderer('front')((
+            row['Local Name'], full_id, row['Department'], row['Position'], None
+        ))
+        back = _get_batch_renderer('back')((
+            row['English Name'], full_id, row['Department_en'], row['Position_en'], None
+        ))
+
+        if not save_to_disk:
+            return [], (sanitize_filename(employee_id), front, back)
+
+        # Wait for both files to reach the disk before reporting the row as done
+        front.result()
+        back.result()
+
+    except Exception as e:
+        return [f"Row {index + 2}: Failed to generate badge for Employee ID {employee_id}: {e}"], None
+
+    return [], None
+
+def batch_generate_badges(presets, selected_preset_name, error_log_path, pdf_config=None, progress_var=None):
+    """
+    Batch generate badges from an Excel or CSV employee sheet using the selected preset.
 
     :param presets: Dictionary of presets from config.json.
     :param selected_preset_name: The name of the currently selected preset.
     :param error_log_path: Path to the error log file.
+    :param pdf_config: If given, skip the badge images on disk and build the PDF
+                       directly from the in-memory badges using this configuration.
+    :param progress_var: Optional tkinter DoubleVar that receives the completion percentage.
     """
     excel_file = filedialog.askopenfilename(
-        title="Select Excel File",
-        filetypes=[("Excel Files", "*.xlsx *.xls")]
+        title="Select Employee Sheet",
+        filetypes=[("Excel Files", "*.xlsx *.xls"), ("CSV Files", "*.csv")]
     )
     if not excel_file:
         return  # User cancelled the dialog
 
+    def report_progress(percent):
+        """
+        Post the batch completion percentage to the progress bar, if one was given.
+        """
+        if progress_var is not None:
+            post_to_gui(lambda: progress_var.set(percent))
+
     def task():
         try:
-            # Specify 'Employee Number' column as string type
-            df = pd.read_excel(excel_file, dtype={'Employee Number': str})
+            df = read_employee_sheet(excel_file)
 
             # Validate required columns
             required_columns = [
@@ -403,8 +742,8 @@ def batch_generate_badges(presets, selected_preset_name, error_log_path):
             ]
             missing_columns = [col for col in required_columns if col not in df.columns]
             if missing_columns:
-                error_message = f"The Excel file is missing the following required columns: {', '.join(missing_columns)}"
-                gui_queue.put(lambda: messagebox.showerror(
+                error_message = f"The employee sheet is missing the following required columns: {', '.join(missing_columns)}"
+                post_to_gui(lambda: messagebox.showerror(
                     "Error",
                     error_message
                 ))
@@ -415,131 +754,118 @@ def batch_generate_badges(presets, selected_preset_name, error_log_path):
             preset_name = selected_preset_name.get()
             if preset_name not in presets:
                 error_message = f"The selected preset '{preset_name}' does not exist."
-                gui_queue.put(lambda: messagebox.showerror("Error", error_message))
+                post_to_gui(lambda: messagebox.showerror("Error", error_message))
                 # Write to error log
                 write_errors_to_log([error_message], error_log_path)
                 return
 
             errors = []  # List to collect error messages
-            errors_lock = threading.Lock()  # Lock to ensure thread-safe access to errors
+            row_errors = []  # (row index, message) pairs, merged into errors in row order at the end
+
+            # Strip every required field once so validation runs as vectorized pandas operations
+            df_str = df[required_columns].astype(str).apply(lambda s: s.str.strip())
 
             # Check for duplicate Employee Numbers
-            employee_numbers = df['Employee Number'].astype(str).str.strip()
+            employee_numbers = df_str['Employee Number']
             duplicates = employee_numbers[employee_numbers.duplicated(keep=False)].unique()
             if len(duplicates) > 0:
                 duplicate_message = f"Duplicate Employee Numbers found: {', '.join(duplicates)}"
                 errors.append(duplicate_message)
 
-            # Helper function to check if a value is missing
-            def is_missing(value):
-                return pd.isna(value) or str(value).strip() == ''
-
-            # Function to process each row
-            def process_row(index, row):
-                try:
-                    # Extract and validate required fields
-                    local_name = row['Local Name']
-                    english_name = row['English Name']
-                    employee_id = row['Employee Number']
-                    department_local = row['Department']
-                    position_local = row['Position']
-                    department_en = row['Department_en']
-                    position_en = row['Position_en']
-
-                    # Check for missing values
-                    missing_fields = []
-                    if is_missing(local_name):
-                        missing_fields.append('Local Name')
-                    if is_missing(english_name):
-                        missing_fields.append('English Name')
-                    if is_missing(employee_id):
-                        missing_fields.append('Employee Number')
-                    if is_missing(department_local):
-                        missing_fields.append('Department')
-                    if is_missing(position_local):
-                        missing_fields.append('Position')
-                    if is_missing(department_en):
-                        missing_fields.append('Department_en')
-                    if is_missing(position_en):
-                        missing_fields.append('Position_en')
-
-                    if missing_fields:
-                        error_message = f"Row {index + 2}: Missing fields - {', '.join(missing_fields)}."
-                        with errors_lock:
-                            errors.append(error_message)
-                        return
-
-                    # Clean employee ID
-                    employee_id = clean_employee_id(str(employee_id).strip())
-
-                    # Convert to string and strip
-                    local_name = str(local_name).strip()
-                    english_name = str(english_name).strip()
-                    department_local = str(department_local).strip()
-                    position_local = str(position_local).strip()
-                    department_en = str(department_en).strip()
-                    position_en = str(position_en).strip()
-
-                    # Check if Employee Number is duplicated
-                    if employee_id in duplicates:
-                        error_message = f"Row {index + 2}: Employee Number '{employee_id}' is duplicated."
-                        with errors_lock:
-                            errors.append(error_message)
-                        return
-
-                    # Generate front badge
-                    front_preset = presets[preset_name]['front'].copy()
-                    front_data = {
-                        'name': local_name,
-                        'id': f"No. {employee_id}",
-                        'department': department_local,
-                        'position': position_local,
-                    }
-                    front_data.update(front_preset)
-                    generate_badge('front', front_data, suppress_message=True)
-
-                    # Generate back badge
-                    back_preset = presets[preset_name]['back'].copy()
-                    back_data = {
-                        'name': english_name,
-                        'id': f"No. {employee_id}",
-                        'department': department_en,
-                        'position': position_en,
-                    }
-                    back_data.update(back_preset)
-                    generate_badge('back', back_data, suppress_message=True)
-
-                except Exception as e:
-                    error_message = f"Row {index + 2}: Failed to generate badge for Employee ID {employee_id}: {e}"
-                    with errors_lock:
-                        errors.append(error_message)
-
-            # Use ThreadPoolExecutor for parallel processing
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                futures = [executor.submit(process_row, idx, row) for idx, row in df.iterrows()]
-                for future in as_completed(futures):
-                    pass  # Errors are handled within process_row
+            # Check for missing values
+            missing_mask = df[required_columns].isna() | (df_str == '')
+            rows_with_missing = missing_mask.any(axis=1)
+            if rows_with_missing.any():
+                missing_fields = missing_mask[rows_with_missing].apply(lambda r: r.index[r].tolist(), axis=1)
+                for index, fields in missing_fields.items():
+                    row_errors.append((index, f"Row {index + 2}: Missing fields - {', '.join(fields)}."))
+
+            # Clean employee IDs and reject rows whose Employee Number is duplicated
+            valid = df_str[~rows_with_missing].copy()
+            valid['Employee Number'] = valid['Employee Number'].map(clean_employee_id)
+            duplicated_rows = valid['Employee Number'].isin(duplicates)
+            for index, employee_id in valid.loc[duplicated_rows, 'Employee Number'].items():
+                row_errors.append((index, f"Row {index + 2}: Employee Number '{employee_id}' is duplicated."))
+            valid = valid[~duplicated_rows]
+
+            # Build lightweight (index, record) payloads of already-validated rows; plain dicts pickle
+            # cheaply and let each row be rendered in its own process
+            payloads = list(zip(valid.index.tolist(), valid.to_dict(orient='records')))
+
+            # Use ProcessPoolExecutor so badge rendering is not serialized by the GIL.
+            # The presets are handed to each worker once through the initializer. Workers are
+            # spawned rather than forked: this runs in a thread of the Tk process, and forking
+            # a multi-threaded process can copy locks held by other threads.
+            badges = []
+            completed = 0
+            last_update = 0.0
+            report_progress(0)
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_batch_worker,
+                initargs=(presets[preset_name]['front'], presets[preset_name]['back'], pdf_config is None)
+            ) as executor:
+                # Each worker returns its own error list, so nothing is shared or locked while rows run
+                results = executor.map(_process_row, payloads, chunksize=8)
+                for (index, _), (worker_errors, badge) in zip(payloads, results):
+                    row_errors.extend((index, error) for error in worker_errors)
+                    if badge:
+                        badges.append(badge)
+
+                    # Coalesce progress into a few updates per second instead of one per row
+                    completed += 1
+                    now = time.monotonic()
+                    if now - last_update >= PROGRESS_INTERVAL:
+                        last_update = now
+                        report_progress(100 * completed / len(payloads))
+            report_progress(100)
+
+            # Merge the per-row errors once, in spreadsheet order
+            row_errors.sort(key=lambda row_error: row_error[0])
+            errors.extend(error for _, error in row_errors)
+
+            # Chain straight into the PDF without writing intermediate images
+            output_pdf = None
+            if pdf_config is not None and badges:
+                badges.sort(key=lambda badge: badge[0])
+                output_pdf = generate_badge_pdf(pdf_config, badges=badges)
 
             # Write all errors to the error log
             if errors:
                 write_errors_to_log(errors, error_log_path)
+                error_message = f"Errors were encountered during batch generation. Please check the error log at:\n{error_log_path}"
+                if output_pdf:
+                    error_message += f"\n\nA PDF of the successfully generated badges was saved at:\n{output_pdf}"
                 # Notify user via message box
-                gui_queue.put(lambda: messagebox.showerror(
-                    "Batch Generation Errors",
-                    f"Errors were encountered during batch generation. Please check the error log at:\n{error_log_path}"
+                post_to_gui(lambda: messagebox.showerror("Batch Generation Errors", error_message))
+            elif output_pdf:
+                # No errors, notify success
+                post_to_gui(lambda: messagebox.showinfo(
+                    "Success",
+                    f"All badges have been successfully generated. PDF saved at:\n{output_pdf}"
+                ))
+            elif pdf_config is not None:
+                # No errors but nothing to lay out, e.g. an empty sheet
+                post_to_gui(lambda: messagebox.showwarning(
+                    "No Badges",
+                    "No badges were generated, so no PDF was created."
                 ))
             else:
                 # No errors, notify success
-                gui_queue.put(lambda: messagebox.showinfo(
+                post_to_gui(lambda: messagebox.showinfo(
                     "Success",
                     "All badges have been successfully generated and saved in the 'Badge_output' folder."
                 ))
 
         except Exception as e:
             error_message = f"Failed to generate badges: {e}"
-            gui_queue.put(lambda: messagebox.showerror("Error", error_message))
+            post_to_gui(lambda: messagebox.showerror("Error", error_message))
             # Write to error log
             write_errors_to_log([f"General Error: {e}"], error_log_path)
+        finally:
+            # Queued after the result message, so the bar clears once that dialog is dismissed
+            report_progress(0)
 
     # Run the task in a separate thread to keep GUI responsive
     threading.Thread(target=task).start()
@@ -560,12 +886,14 @@ def write_errors_to_log(errors, error_log_path):
     except Exception as e:
         # If writing to the log fails, notify the user
         error_message = f"Failed to write to error log: {e}"
-        gui_queue.put(lambda: messagebox.showerror("Error", error_message))
+        post_to_gui(lambda: messagebox.showerror("Error", error_message))
 
 def create_gui():
     """
     Create and launch the main GUI for the Badge Generator application.
     """
+    global gui_window
+
     window = tk.Tk()
     window.title("Badge Generator")
     window.geometry('1200x400')  # Increased height for better layout
@@ -612,10 +940,27 @@ def create_gui():
         command=lambda: generate_pdf_action(config)
     ).pack(side=tk.RIGHT, padx=5)
 
+    tk.Button(
+        right_subframe,
+        text="Batch Generate PDF",
+        command=lambda: batch_generate_badges(
+            presets, selected_preset, error_log_path, pdf_config=config, progress_var=batch_progress
+        )
+    ).pack(side=tk.RIGHT, padx=5)
+
     tk.Button(
         right_subframe,
         text="Batch Generate Badges",
-        command=lambda: batch_generate_badges(presets, selected_preset, error_log_path)
+        command=lambda: batch_generate_badges(presets, selected_preset, error_log_path, progress_var=batch_progress)
+    ).pack(side=tk.RIGHT, padx=5)
+
+    # Batch progress, updated a few times per second while a batch runs
+    batch_progress = tk.DoubleVar(value=0)
+    ttk.Progressbar(
+        right_subframe,
+        variable=batch_progress,
+        maximum=100,
+        length=150
     ).pack(side=tk.RIGHT, padx=5)
 
     def generate_pdf_action(config):
@@ -625,10 +970,10 @@ def create_gui():
         def task():
             try:
                 output_pdf = generate_badge_pdf(config)
-                gui_queue.put(lambda: messagebox.showinfo("Success", f"PDF successfully generated at:\n{output_pdf}"))
+                post_to_gui(lambda: messagebox.showinfo("Success", f"PDF successfully generated at:\n{output_pdf}"))
             except Exception as e:
                 error_message = f"Failed to generate PDF: {e}"
-                gui_queue.put(lambda: messagebox.showerror("Error", error_message))
+                post_to_gui(lambda: messagebox.showerror("Error", error_message))
 
         # Run PDF generation in a separate thread
         threading.Thread(target=task).start()
@@ -659,12 +1004,21 @@ def create_gui():
                 task()
         except queue.Empty:
             pass
-        window.after(100, process_gui_queue)  # Check the queue every 100ms
 
-    # Start processing the GUI queue
-    window.after(100, process_gui_queue)
+    def backup_poll():
+        """
+        Drain the queue once a second in case a notification was missed.
+        """
+        process_gui_queue()
+        window.after(1000, backup_poll)
+
+    # Process the GUI queue whenever post_to_gui notifies the window
+    window.bind('<<GuiQueue>>', lambda event: process_gui_queue())
+    gui_window = window
+    window.after(1000, backup_poll)
 
     window.mainloop()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
     create_gui()